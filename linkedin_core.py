@@ -0,0 +1,295 @@
+"""
+LinkedIn Job Scraper core
+
+Shared prompting, fetching and parsing for the scraper front-ends.
+Each front-end only supplies its own sink for the scraped rows.
+
+Author: [Charan Yelimela]
+"""
+
+import asyncio
+import csv
+import multiprocessing
+import os
+import random
+import urllib.parse
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Dict, Optional
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+import diskcache
+from bs4 import BeautifulSoup
+import lxml.html
+
+
+BACKUP_CSV_FILE = "linkedin_jobs_backup.csv"  # <-- Rows are streamed here as they are scraped
+
+COLUMNS = ["job_url", "job_title", "company_name", "job_location", "time_posted", "num_applicants", "job_description_preview"]
+
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+]
+
+# aiohttp already negotiates gzip/deflate (and br with Brotli installed)
+HEADERS = {
+    "User-Agent": random.choice(USER_AGENTS),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# One keep-alive pool is shared by every listing and detail request
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _new_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+    return aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT, headers=HEADERS)
+
+
+# Repeat runs reuse recently fetched pages instead of downloading them again
+CACHE_DIR = "./.job_cache"
+LISTING_CACHE_TTL = 30 * 60  # seconds; search results change quickly
+DETAIL_CACHE_TTL = 24 * 60 * 60  # seconds; one daily update cycle
+_CACHE = diskcache.Cache(CACHE_DIR)
+
+# A parse takes ~0.1 ms on a thread while each spawned worker costs hundreds of
+# ms to start, so the process pool is reserved for very large batches
+PARSE_POOL_MIN_PENDING = 500
+PARSE_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Token bucket shared by every request of a scrape, so pacing is independent of concurrency
+REQUESTS_PER_MINUTE = 40  # at or above the old serial pacing of a 1-2s sleep per request
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 5
+
+
+async def _get_html(session: aiohttp.ClientSession, limiter: AsyncLimiter, url: str) -> Optional[str]:
+    # Back off 1s, 2s, 4s, 8s (±25% jitter) on rate limiting and server errors
+    for attempt in range(MAX_ATTEMPTS):
+        async with limiter:
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+                if resp.status not in RETRY_STATUSES:
+                    return None
+        if attempt < MAX_ATTEMPTS - 1:
+            await asyncio.sleep((2 ** attempt) * random.uniform(0.75, 1.25))
+    return None
+
+
+# (tag, class) -> field; the first matching element in document order wins
+_FIELD_CLASSES = {
+    ("a", "topcard__org-name-link"): "company_name",
+    ("span", "topcard__flavor--bullet"): "job_location",
+    ("span", "posted-time-ago__text"): "time_posted",
+    ("span", "num-applicants__caption"): "num_applicants",
+    ("div", "show-more-less-html__markup"): "job_description_preview",
+}
+_FIELD_TAGS = ("h2",) + tuple(sorted({tag for tag, _ in _FIELD_CLASSES}))
+_FIELD_COUNT = len(_FIELD_CLASSES) + 1  # plus the untagged first <h2> title
+
+
+def _extract_fields(doc) -> Dict[str, str]:
+    # One walk over the tree fills every field, stopping once all are found
+    fields = {}
+    for el in doc.iter(*_FIELD_TAGS):
+        if el.tag == "h2":
+            if "job_title" not in fields:
+                fields["job_title"] = el.text_content().strip()
+        else:
+            for cls in el.get("class", "").split():
+                field = _FIELD_CLASSES.get((el.tag, cls))
+                if field and field not in fields:
+                    fields[field] = el.text_content().strip()
+                    break
+        if len(fields) == _FIELD_COUNT:
+            break
+    return fields
+
+
+DATE_FILTER_MAP = {"1": "", "2": "r2592000", "3": "r604800", "4": "r86400"}
+EXP_FILTER_MAP = {"1": "", "2": "1", "3": "2", "4": "3", "5": "4", "6": "5", "7": "6"}
+ALL_EXP_LEVELS = ",".join(EXP_FILTER_MAP[str(i)] for i in range(2, 8))
+
+
+def get_user_input(edition: str) -> tuple[str, str, int, str, str]:
+    print("=" * 60)
+    print(f"🔍 LinkedIn Job Scraper - {edition}")
+    print("=" * 60)
+
+    job_title = input("📋 Enter the job role/title: ").strip()
+    while not job_title:
+        job_title = input("❌ Can't be empty. Enter job title: ").strip()
+
+    job_location = input("📍 Enter the job location: ").strip()
+    while not job_location:
+        job_location = input("❌ Can't be empty. Enter location: ").strip()
+
+    print("\n🗓️ Date Posted Filter:")
+    print("1. Any time\n2. Past month\n3. Past week (default)\n4. Past 24 hours")
+    date_choice = input("Choose (1-4, default 3): ").strip() or "3"
+    date_filter = DATE_FILTER_MAP.get(date_choice, "r604800")
+
+    print("\n🎓 Experience Levels:")
+    print("1. Any level (default)\n2. Internship\n3. Entry\n4. Associate\n5. Mid-Senior\n6. Director\n7. Executive")
+    exp_choice = input("Enter levels (e.g. 3,4 or 'all'): ").strip().lower()
+
+    if exp_choice == "all":
+        exp_filter = ALL_EXP_LEVELS
+    elif not exp_choice or exp_choice == "1":
+        exp_filter = ""
+    else:
+        levels = [EXP_FILTER_MAP.get(l.strip()) for l in exp_choice.split(",") if l.strip() in EXP_FILTER_MAP]
+        exp_filter = ",".join(filter(None, levels))
+
+    max_jobs = input("📊 How many jobs to scrape? (default 25, max 100): ").strip()
+    max_jobs = int(max_jobs) if max_jobs and max_jobs.isdigit() else 25
+
+    return job_title, job_location, max_jobs, date_filter, exp_filter
+
+
+async def _fetch_page(session: aiohttp.ClientSession, limiter: AsyncLimiter, url: str, sem: asyncio.Semaphore) -> Optional[list]:
+    try:
+        html = _CACHE.get(url)
+        if html is None:
+            async with sem:
+                html = await _get_html(session, limiter, url)
+                if html is None:
+                    return None
+            _CACHE.set(url, html, expire=LISTING_CACHE_TTL)
+        soup = BeautifulSoup(html, "lxml")
+        return soup.find_all("li")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+
+async def fetch_job_ids(session: aiohttp.ClientSession, limiter: AsyncLimiter, title: str, location: str, max_jobs: int, date_filter: str = "", exp_filter: str = "") -> List[str]:
+    # Only the page offset varies, so encode the rest of the query once
+    base = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={urllib.parse.quote(title)}&location={urllib.parse.quote(location)}"
+    if date_filter:
+        base += f"&f_TPR={date_filter}"
+    if exp_filter:
+        base += f"&f_E={exp_filter}"
+
+    ids = []
+    seen = set()
+
+    def collect(jobs: list) -> None:
+        for job in jobs:
+            base_card = job.find("div", {"class": "base-card"})
+            urn = base_card.get("data-entity-urn") if base_card else None
+            if urn:
+                job_id = urn.rpartition(":")[2]
+                if job_id not in seen:
+                    seen.add(job_id)
+                    ids.append(job_id)
+                if len(ids) >= max_jobs:
+                    return
+
+    # Probe the first page alone so an empty search costs a single request
+    sem = asyncio.Semaphore(4)
+    jobs = await _fetch_page(session, limiter, f"{base}&start=0", sem)
+    if not jobs:
+        return ids
+    collect(jobs)
+    if not ids or len(ids) >= max_jobs:
+        return ids
+
+    # Fetch the rest of the pages max_jobs needs at best all at once
+    starts = range(25, max_jobs, 25)
+    pages = await asyncio.gather(*[_fetch_page(session, limiter, f"{base}&start={start}", sem) for start in starts])
+    for jobs in pages:
+        # A failed or empty page ends the listing, as with serial paging
+        if not jobs:
+            return ids
+        collect(jobs)
+        if len(ids) >= max_jobs:
+            return ids
+
+    # Duplicates or short pages left us below max_jobs; keep paging until the listing runs out
+    start = 25 + len(starts) * 25
+    while len(ids) < max_jobs:
+        jobs = await _fetch_page(session, limiter, f"{base}&start={start}", sem)
+        if not jobs:
+            break
+        collect(jobs)
+        start += 25
+    return ids
+
+
+def _parse_job_details(job_id: str, html: str) -> Dict[str, Optional[str]]:
+    # Pure function so it can run in a worker process
+    # lxml rejects an empty document; keep the URL-only row like the old soup path
+    fields = _extract_fields(lxml.html.fromstring(html)) if html.strip() else {}
+    description = fields.get("job_description_preview")
+    return {
+        "job_url": f"https://www.linkedin.com/jobs/view/{job_id}",
+        "job_title": fields.get("job_title"),
+        "company_name": fields.get("company_name"),
+        "job_location": fields.get("job_location"),
+        "time_posted": fields.get("time_posted"),
+        "num_applicants": fields.get("num_applicants"),
+        "job_description_preview": description[:200] if description is not None else None
+    }
+
+
+async def _download_job(session: aiohttp.ClientSession, limiter: AsyncLimiter, job_id: str, sem: asyncio.Semaphore) -> Optional[str]:
+    url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+    async with sem:
+        return await _get_html(session, limiter, url)
+
+
+async def fetch_job_details(session: aiohttp.ClientSession, limiter: AsyncLimiter, job_id: str, sem: asyncio.Semaphore, pool: Optional[Executor] = None) -> Optional[Dict[str, Optional[str]]]:
+    hit = _CACHE.get(job_id)
+    if hit is not None:
+        return hit
+    try:
+        html = await _download_job(session, limiter, job_id, sem)
+        if html is None:
+            return None
+        job = await asyncio.get_running_loop().run_in_executor(pool, _parse_job_details, job_id, html)
+        _CACHE.set(job_id, job, expire=DETAIL_CACHE_TTL)
+        return job
+    except Exception:
+        return None
+
+
+async def scrape_linkedin_jobs(title: str, location: str, max_jobs: int, date_filter: str = "", exp_filter: str = "", csv_file: str = BACKUP_CSV_FILE) -> List[Dict[str, Optional[str]]]:
+    print(f"\n🔍 Searching for '{title}' jobs in '{location}'...")
+    # Created per run so the limiter is bound to this run's event loop
+    limiter = AsyncLimiter(REQUESTS_PER_MINUTE, 60)
+    async with _new_session() as session:
+        job_ids = await fetch_job_ids(session, limiter, title, location, max_jobs, date_filter, exp_filter)
+        if not job_ids:
+            print("❌ No job IDs found.")
+            return []
+
+        print(f"📊 Found {len(job_ids)} job IDs.")
+        print(f"🔄 Fetching {len(job_ids)} job details concurrently...")
+        sem = asyncio.Semaphore(8)
+        # Small batches parse on the loop's default executor; spawned workers only
+        # pay off once enough uncached pages are waiting to be parsed.
+        pending = sum(job_id not in _CACHE for job_id in job_ids)
+        needs_pool = pending >= PARSE_POOL_MIN_PENDING
+        pool_cm = ProcessPoolExecutor(max_workers=PARSE_POOL_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")) if needs_pool else nullcontext()
+        with pool_cm as pool, open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+
+            # Each row hits disk as soon as it arrives, so an interrupted run keeps its progress
+            async def fetch_and_record(job_id: str) -> Optional[Dict[str, Optional[str]]]:
+                job = await fetch_job_details(session, limiter, job_id, sem, pool)
+                if job:
+                    writer.writerow(job)
+                    f.flush()
+                return job
+
+            results = await asyncio.gather(*[fetch_and_record(job_id) for job_id in job_ids])
+    print(f"💾 Rows saved to {csv_file}")
+    return [job for job in results if job]